@@ -0,0 +1,30 @@
+"""Small helpers shared by the pipeline scripts."""
+import re
+
+# Anchored single-pass match; DOTALL so values may contain newlines.
+_KV_RE = re.compile(r'([^=]+)=(.*)', re.DOTALL)
+
+
+def parse_kv_list(items, on_malformed=None):
+    """
+    Converts an iterable of 'key=value' strings into a dictionary.
+
+    Values may contain '=' characters; only the first one splits. Entries
+    without an '=' are skipped and reported through on_malformed (if given)
+    so each caller keeps its own warning style.
+
+    Args:
+        items: Iterable of 'key=value' strings (None is treated as empty)
+        on_malformed: Optional callable invoked with each malformed entry
+
+    Returns:
+        dict: {key: value, ...}
+    """
+    params = {}
+    for item in items or ():
+        match = _KV_RE.fullmatch(item)
+        if match:
+            params[match.group(1)] = match.group(2)
+        elif on_malformed is not None:
+            on_malformed(item)
+    return params
@@ -24,18 +24,55 @@ Options:
 
 import argparse
 import boto3
+import concurrent.futures
+import functools
+import io
+import logging
+import os
 import yaml
 import subprocess
 import json
 import sys
 
+import botocore.config
+
+from _util import parse_kv_list
+
+# Progress goes through a logger instead of print: library callers pay no
+# stdout I/O unless they configure logging, the CLI keeps stdout clean for
+# result output, and log records are thread-safe under the discovery pool
+# (unlike the builtins.print swap the old --quiet mode used).
+log = logging.getLogger(__name__)
+
+# orjson encodes large parameter sets several times faster than the stdlib
+# encoder; fall back silently when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj):
+        # Sorted keys keep the JSON output stable across runs, which makes
+        # Jenkins log diffs meaningful; text output already sorts.
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, sort_keys=True)
+
+# Prefer the libyaml-backed loader when available; it parses large
+# CloudFormation templates an order of magnitude faster than the pure-Python one.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 def general_tag_handler(loader, tag_suffix, node):
     """
     YAML tag handler for CloudFormation intrinsic functions.
     Allows safe_load to handle !Ref, !Sub, etc. without errors.
     """
     if isinstance(node, yaml.ScalarNode):
-        return loader.construct_scalar(node)
+        # The dominant case (!Ref, !Sub, !GetAtt take scalar arguments); the
+        # value is already the plain string, so skip construct_scalar.
+        return node.value
     elif isinstance(node, yaml.SequenceNode):
         return loader.construct_sequence(node)
     elif isinstance(node, yaml.MappingNode):
@@ -43,9 +80,70 @@ def general_tag_handler(loader, tag_suffix, node):
     else:
         return None
 
-yaml.SafeLoader.add_multi_constructor('!', general_tag_handler)
+# Register on _SafeLoader directly: CSafeLoader is a separate class and does
+# not pick up constructors added to yaml.SafeLoader.
+_SafeLoader.add_multi_constructor('!', general_tag_handler)
+
 
+# boto3 clients are expensive to construct (service model load + endpoint
+# resolution) and thread-safe once built, so share one per (service, region)
+# from a single Session. The pool is sized for the concurrent discovery
+# fan-out, and adaptive retries rate-limit client-side before AWS throttles.
+_CLIENT_CONFIG = botocore.config.Config(
+    max_pool_connections=32,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    return boto3.session.Session()
+
+@functools.lru_cache(maxsize=32)
+def _client(service, region):
+    return _get_session().client(service, region_name=region, config=_CLIENT_CONFIG)
+
+
+# VPCs, hosted zones, subnets, route tables and stack outputs are effectively
+# static for the duration of a deployment run, so the discovery helpers are
+# memoized: a driver resolving several stacks in one process pays each
+# describe call once. Long-running callers can drop the caches explicitly.
+@functools.lru_cache(maxsize=1)
+def _git_short_sha():
+    """
+    Short commit SHA for BuildId. Prefers $GIT_COMMIT (Jenkins sets it, so CI
+    pays no fork at all), then reads .git/HEAD directly, and only shells out
+    to git as a last resort (worktrees, submodules, packed refs).
+    """
+    git_commit = os.environ.get('GIT_COMMIT')
+    if git_commit:
+        return git_commit[:7]
+    try:
+        with open('.git/HEAD') as f:
+            head = f.read().strip()
+        if head.startswith('ref: '):
+            with open(os.path.join('.git', head[5:])) as f:
+                return f.read().strip()[:7]
+        return head[:7]
+    except OSError:
+        pass
+    return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('utf-8').strip()
 
+
+def invalidate_caches():
+    """Clear all memoized AWS discovery results."""
+    for cached in (get_vpc_data, get_hosted_zone_data, get_subnet_data,
+                   get_route_table_data, get_stack_outputs):
+        cached.cache_clear()
+
+
+def _primary_cidr(vpc):
+    """Return the associated CIDR block of a VPC, falling back to CidrBlock."""
+    return next((assoc['CidrBlock'] for assoc in vpc.get('CidrBlockAssociationSet') or []
+                 if assoc.get('CidrBlockState', {}).get('State') == 'associated'),
+                vpc.get('CidrBlock'))
+
+
+@functools.lru_cache(maxsize=None)
 def get_vpc_data(aws_region, environment_name):
     """
     Fetches VPC data for the specified region and environment.
@@ -60,50 +158,51 @@ def get_vpc_data(aws_region, environment_name):
     Returns:
         dict: {"VPCId": vpc_id, "VPCCidr": vpc_cidr}
     """
-    print(f"Fetching VPC data for region {aws_region} and environment {environment_name}...")
-    ec2_client = boto3.client('ec2', region_name=aws_region)
+    log.info(f"Fetching VPC data for region {aws_region} and environment {environment_name}...")
+    ec2_client = _client('ec2', aws_region)
     vpc_id = None
     vpc_cidr = None
 
     try:
-        response = ec2_client.describe_vpcs()
-        vpcs = response.get('Vpcs', [])
-        
+        # Prefer a server-side tag filter: deterministic selection and a tiny
+        # response on accounts with many VPCs. Fall back to the unfiltered
+        # listing when no VPC is tagged for this environment. Paginate in both
+        # cases (a raw describe_vpcs truncates silently on large accounts) and
+        # stop at the first page that yields a match.
+        paginator = ec2_client.get_paginator('describe_vpcs')
+        vpcs = []
+        for page in paginator.paginate(
+                Filters=[{'Name': 'tag:Environment', 'Values': [environment_name]}]):
+            vpcs.extend(page.get('Vpcs', []))
+            if vpcs:
+                break
         if not vpcs:
-            print(f"Warning: No VPCs found in region {aws_region}.")
-        elif len(vpcs) > 1:
-            print(f"Warning: Multiple VPCs found in region {aws_region}. Using the first one: {vpcs[0]['VpcId']}.")
-            vpc_id = vpcs[0]['VpcId']
-            if 'CidrBlockAssociationSet' in vpcs[0] and vpcs[0]['CidrBlockAssociationSet']:
-                for assoc in vpcs[0]['CidrBlockAssociationSet']:
-                    if assoc.get('CidrBlockState', {}).get('State') == 'associated':
-                        vpc_cidr = assoc['CidrBlock']
-                        break
-            if not vpc_cidr and 'CidrBlock' in vpcs[0]:
-                 vpc_cidr = vpcs[0]['CidrBlock']
+            for page in paginator.paginate():
+                vpcs.extend(page.get('Vpcs', []))
+                if vpcs:
+                    break
 
+        if not vpcs:
+            log.warning(f"Warning: No VPCs found in region {aws_region}.")
         else:
+            if len(vpcs) > 1:
+                log.warning(f"Warning: Multiple VPCs found in region {aws_region}. Using the first one: {vpcs[0]['VpcId']}.")
             vpc_id = vpcs[0]['VpcId']
-            if 'CidrBlockAssociationSet' in vpcs[0] and vpcs[0]['CidrBlockAssociationSet']:
-                for assoc in vpcs[0]['CidrBlockAssociationSet']:
-                    if assoc.get('CidrBlockState', {}).get('State') == 'associated':
-                        vpc_cidr = assoc['CidrBlock']
-                        break
-            if not vpc_cidr and 'CidrBlock' in vpcs[0]:
-                 vpc_cidr = vpcs[0]['CidrBlock']
+            vpc_cidr = _primary_cidr(vpcs[0])
 
     except Exception as e:
-        print(f"Error fetching VPC data: {e}")
+        log.error(f"Error fetching VPC data: {e}")
         raise
 
     if vpc_id and vpc_cidr:
-        print(f"Retrieved VPCId: {vpc_id}, VPCCidr: {vpc_cidr}")
+        log.info(f"Retrieved VPCId: {vpc_id}, VPCCidr: {vpc_cidr}")
     else:
-        print("Warning: Could not retrieve valid VPCId and VPCCidr.")
+        log.warning("Warning: Could not retrieve valid VPCId and VPCCidr.")
         
     return {"VPCId": vpc_id, "VPCCidr": vpc_cidr}
 
 
+@functools.lru_cache(maxsize=None)
 def get_hosted_zone_data(aws_region, hosted_zone_suffix):
     """
     Fetches hosted zone data for zones ending with the specified suffix.
@@ -123,8 +222,8 @@ def get_hosted_zone_data(aws_region, hosted_zone_suffix):
             "PrivateHostedZoneId": id
         }
     """
-    print(f"Fetching hosted zone data for region {aws_region} with suffix '{hosted_zone_suffix}'...")
-    client = boto3.client('route53', region_name=aws_region)
+    log.info(f"Fetching hosted zone data for region {aws_region} with suffix '{hosted_zone_suffix}'...")
+    client = _client('route53', aws_region)
     
     hosted_zone_info = {
         "PublicHostedZoneName": None,
@@ -139,42 +238,58 @@ def get_hosted_zone_data(aws_region, hosted_zone_suffix):
         search_suffix = hosted_zone_suffix
 
     try:
-        paginator = client.get_paginator('list_hosted_zones')
-        for page in paginator.paginate():
-            for zone in page['HostedZones']:
+        # list_hosted_zones_by_name starts the listing at the suffix in DNS
+        # order, so matching zones arrive in the first page instead of walking
+        # every zone in the account. Zones ending with the suffix form a
+        # contiguous block, so stop at the first non-matching name.
+        # The suffix rarely has more than a handful of zones (one public, one
+        # private); a small first page keeps the response minimal and the
+        # while loop continues in the unlikely case the block is larger.
+        kwargs = {'DNSName': search_suffix.rstrip('.'), 'MaxItems': '20'}
+        done = False
+        while not done:
+            response = client.list_hosted_zones_by_name(**kwargs)
+            for zone in response['HostedZones']:
                 zone_name = zone['Name']
+                if not zone_name.endswith(search_suffix):
+                    done = True
+                    break
                 zone_id = zone['Id'].replace('/hostedzone/', '')
                 is_private = zone['Config']['PrivateZone']
+                processed_zone_name = zone_name.rstrip('.')
+                if is_private:
+                    if not hosted_zone_info["PrivateHostedZoneName"]:
+                        hosted_zone_info["PrivateHostedZoneName"] = processed_zone_name
+                        hosted_zone_info["PrivateHostedZoneId"] = zone_id
+                else:
+                    if not hosted_zone_info["PublicHostedZoneName"]:
+                        hosted_zone_info["PublicHostedZoneName"] = processed_zone_name
+                        hosted_zone_info["PublicHostedZoneId"] = zone_id
 
-                if zone_name.endswith(search_suffix):
-                    processed_zone_name = zone_name.rstrip('.')
-                    if is_private:
-                        if not hosted_zone_info["PrivateHostedZoneName"]:
-                            hosted_zone_info["PrivateHostedZoneName"] = processed_zone_name
-                            hosted_zone_info["PrivateHostedZoneId"] = zone_id
-                    else: 
-                        if not hosted_zone_info["PublicHostedZoneName"]:
-                            hosted_zone_info["PublicHostedZoneName"] = processed_zone_name
-                            hosted_zone_info["PublicHostedZoneId"] = zone_id
-                
                 if hosted_zone_info["PublicHostedZoneName"] and hosted_zone_info["PrivateHostedZoneName"]:
+                    done = True
                     break
-            if hosted_zone_info["PublicHostedZoneName"] and hosted_zone_info["PrivateHostedZoneName"]:
-                break
-                
+            else:
+                if response.get('IsTruncated'):
+                    kwargs['DNSName'] = response['NextDNSName']
+                    kwargs['HostedZoneId'] = response['NextHostedZoneId']
+                else:
+                    done = True
+
     except Exception as e:
-        print(f"Error fetching hosted zones: {e}")
+        log.error(f"Error fetching hosted zones: {e}")
         raise
 
     if not hosted_zone_info["PublicHostedZoneName"]:
-        print(f"Warning: Public hosted zone ending with '{search_suffix}' not found.")
+        log.warning(f"Warning: Public hosted zone ending with '{search_suffix}' not found.")
     if not hosted_zone_info["PrivateHostedZoneName"]:
-        print(f"Warning: Private hosted zone ending with '{search_suffix}' not found.")
+        log.warning(f"Warning: Private hosted zone ending with '{search_suffix}' not found.")
 
-    print(f"Retrieved Hosted Zone Info: {hosted_zone_info}")
+    log.info(f"Retrieved Hosted Zone Info: {hosted_zone_info}")
     return hosted_zone_info
 
 
+@functools.lru_cache(maxsize=None)
 def get_subnet_data(aws_region, vpc_id):
     """
     Fetches subnet data for the specified VPC.
@@ -194,46 +309,47 @@ def get_subnet_data(aws_region, vpc_id):
         dict: {subnet_name: subnet_id, ...}
         Example: {"PrivateSubnet1A": "subnet-abc123", "PublicSubnet2A": "subnet-def456"}
     """
-    print(f"Fetching subnet data for VPC {vpc_id} in region {aws_region}...")
-    ec2_client = boto3.client('ec2', region_name=aws_region)
+    log.info(f"Fetching subnet data for VPC {vpc_id} in region {aws_region}...")
+    ec2_client = _client('ec2', aws_region)
     subnet_params = {}
 
     if not vpc_id:
-        print("Warning: VPCId not provided, cannot fetch subnet data.")
+        log.warning("Warning: VPCId not provided, cannot fetch subnet data.")
         return subnet_params
 
     try:
         paginator = ec2_client.get_paginator('describe_subnets')
-        for page in paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]):
+        # tag-key=Name drops unnamed subnets server-side; they were discarded
+        # client-side anyway.
+        for page in paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]},
+                                                {'Name': 'tag-key', 'Values': ['Name']}],
+                                       PaginationConfig={'PageSize': 1000}):
             for subnet in page['Subnets']:
                 subnet_id = subnet['SubnetId']
-                subnet_name_tag = None
-                if 'Tags' in subnet:
-                    for tag in subnet['Tags']:
-                        if tag['Key'] == 'Name':
-                            subnet_name_tag = tag['Value']
-                            break
-                
+                subnet_name_tag = next(
+                    (tag['Value'] for tag in subnet.get('Tags', ()) if tag['Key'] == 'Name'), None)
+
                 if subnet_name_tag:
                     # Parse AWS Control Tower subnet names
                     # Convert "aws-controltower-PrivateSubnet1A" to "PrivateSubnet1A"
                     if subnet_name_tag.startswith('aws-controltower-'):
                         parsed_name = subnet_name_tag.replace('aws-controltower-', '')
-                        print(f"Parsed Control Tower subnet: {subnet_name_tag} -> {parsed_name} = {subnet_id}")
+                        log.info(f"Parsed Control Tower subnet: {subnet_name_tag} -> {parsed_name} = {subnet_id}")
                         subnet_params[parsed_name] = subnet_id
                     else:
                         # For non-Control Tower subnets, use the name as-is
                         subnet_params[subnet_name_tag] = subnet_id
                 else:
-                    print(f"Warning: Subnet {subnet_id} does not have a 'Name' tag. It will not be added to params by its name.")
+                    log.warning(f"Warning: Subnet {subnet_id} does not have a 'Name' tag. It will not be added to params by its name.")
     except Exception as e:
-        print(f"Error fetching subnet data: {e}")
+        log.error(f"Error fetching subnet data: {e}")
         raise
 
-    print(f"Retrieved Subnet Info: {subnet_params}")
+    log.info(f"Retrieved Subnet Info: {subnet_params}")
     return subnet_params
 
 
+@functools.lru_cache(maxsize=None)
 def get_route_table_data(aws_region, vpc_id):
     """
     Fetches route table data for the specified VPC.
@@ -253,46 +369,44 @@ def get_route_table_data(aws_region, vpc_id):
         dict: {route_table_name: route_table_id, ...}
         Example: {"PrivateSubnet1ARouteTable": "rtb-abc123", "PublicSubnet1ARouteTable": "rtb-def456"}
     """
-    print(f"Fetching route table data for VPC {vpc_id} in region {aws_region}...")
-    ec2_client = boto3.client('ec2', region_name=aws_region)
+    log.info(f"Fetching route table data for VPC {vpc_id} in region {aws_region}...")
+    ec2_client = _client('ec2', aws_region)
     route_table_params = {}
 
     if not vpc_id:
-        print("Warning: VPCId not provided, cannot fetch route table data.")
+        log.warning("Warning: VPCId not provided, cannot fetch route table data.")
         return route_table_params
 
     try:
         paginator = ec2_client.get_paginator('describe_route_tables')
-        for page in paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]):
+        for page in paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}],
+                                       PaginationConfig={'PageSize': 1000}):
             for route_table in page['RouteTables']:
                 route_table_id = route_table['RouteTableId']
-                route_table_name_tag = None
-                if 'Tags' in route_table:
-                    for tag in route_table['Tags']:
-                        if tag['Key'] == 'Name':
-                            route_table_name_tag = tag['Value']
-                            break
-                
+                route_table_name_tag = next(
+                    (tag['Value'] for tag in route_table.get('Tags', ()) if tag['Key'] == 'Name'), None)
+
                 if route_table_name_tag:
                     # Parse AWS Control Tower route table names
                     # Convert "aws-controltower-PrivateSubnet1ARouteTable" to "PrivateSubnet1ARouteTable"
                     if route_table_name_tag.startswith('aws-controltower-'):
                         parsed_name = route_table_name_tag.replace('aws-controltower-', '')
-                        print(f"Parsed Control Tower route table: {route_table_name_tag} -> {parsed_name} = {route_table_id}")
+                        log.info(f"Parsed Control Tower route table: {route_table_name_tag} -> {parsed_name} = {route_table_id}")
                         route_table_params[parsed_name] = route_table_id
                     else:
                         # For non-Control Tower route tables, use the name as-is
                         route_table_params[route_table_name_tag] = route_table_id
                 else:
-                    print(f"Warning: Route table {route_table_id} does not have a 'Name' tag. It will not be added to params by its name.")
+                    log.warning(f"Warning: Route table {route_table_id} does not have a 'Name' tag. It will not be added to params by its name.")
     except Exception as e:
-        print(f"Error fetching route table data: {e}")
+        log.error(f"Error fetching route table data: {e}")
         raise
 
-    print(f"Retrieved Route Table Info: {route_table_params}")
+    log.info(f"Retrieved Route Table Info: {route_table_params}")
     return route_table_params
 
 
+@functools.lru_cache(maxsize=None)
 def get_stack_outputs(stack_region, resource_name, environment_name, base_stack_name):
     """
     Retrieves outputs from a CloudFormation stack.
@@ -315,164 +429,152 @@ def get_stack_outputs(stack_region, resource_name, environment_name, base_stack_
     else:
         actual_stack_name = f"{environment_name.upper()}-{base_stack_name}".replace('_', '-')
     
-    print(f"Attempting to retrieve outputs for stack: {actual_stack_name} in region {stack_region}...")
-    cf_client = boto3.client('cloudformation', region_name=stack_region)
+    log.info(f"Attempting to retrieve outputs for stack: {actual_stack_name} in region {stack_region}...")
+    cf_client = _client('cloudformation', stack_region)
     retrieved_outputs = {}
 
     try:
         stack_description_response = cf_client.describe_stacks(StackName=actual_stack_name)
         
         if not stack_description_response or not stack_description_response.get('Stacks'):
-            print(f"Warning: Stack {actual_stack_name} not found or description is empty.")
+            log.warning(f"Warning: Stack {actual_stack_name} not found or description is empty.")
             return retrieved_outputs
 
         stack_info = stack_description_response['Stacks'][0]
         outputs = stack_info.get('Outputs')
 
         if outputs:
-            print(f"Found outputs for stack {actual_stack_name}:")
+            log.info(f"Found outputs for stack {actual_stack_name}:")
             for output in outputs:
                 output_key = output.get('OutputKey')
                 output_value = output.get('OutputValue')
                 if output_key:
-                    print(f"  Retrieved output: {output_key} = {output_value}")
+                    log.info(f"  Retrieved output: {output_key} = {output_value}")
                     retrieved_outputs[output_key] = output_value
-            print("Stack outputs retrieved.")
+            log.info("Stack outputs retrieved.")
         else:
-            print(f"No outputs found for stack {actual_stack_name}.")
+            log.info(f"No outputs found for stack {actual_stack_name}.")
 
     except cf_client.exceptions.ClientError as e:
         if "does not exist" in str(e):
-            print(f"ERROR: Stack {actual_stack_name} does not exist in region {stack_region}.")
-            print(f"  Stack name searched: {actual_stack_name}")
-            print(f"  Region searched: {stack_region}")
-            print(f"  AWS error: {e}")
+            log.error(f"ERROR: Stack {actual_stack_name} does not exist in region {stack_region}.")
+            log.error(f"  Stack name searched: {actual_stack_name}")
+            log.error(f"  Region searched: {stack_region}")
+            log.error(f"  AWS error: {e}")
             return retrieved_outputs  # Return empty dict to trigger failure in caller
         else:
-            print(f"ERROR: Failed to describe stack {actual_stack_name} to get outputs: {e}")
+            log.error(f"ERROR: Failed to describe stack {actual_stack_name} to get outputs: {e}")
             raise
     except Exception as e:
-        print(f"ERROR: Unexpected error occurred while retrieving outputs for stack {actual_stack_name}: {e}")
+        log.error(f"ERROR: Unexpected error occurred while retrieving outputs for stack {actual_stack_name}: {e}")
         raise
     
     return retrieved_outputs
 
 
-def format_params_pretty(params):
+# Category lists used by the pretty formatter. Kept out of the params dict
+# itself: resolve_baseline_params returns parameter values only, so consumers
+# no longer need to filter a '_metadata' sentinel out of every output path.
+PARAM_METADATA = {
+    'base': ['AccountId', 'Region', 'ResourceName', 'EnvironmentNameLower', 'EnvironmentNameUpper'],
+    'vpc': ['VPCId', 'VPCCidr'],
+    'hosted_zones': ['PublicHostedZoneName', 'PublicHostedZoneId', 'PrivateHostedZoneName', 'PrivateHostedZoneId'],
+    'build': ['BuildId']
+}
+
+
+# Keys covered by the default metadata categories, precomputed as a frozenset
+# so the formatter's membership checks skip rebuilding the set per call.
+_DEFAULT_CATEGORIZED = frozenset(
+    key for keys in PARAM_METADATA.values() for key in keys)
+
+# Display titles for the metadata categories, in output order.
+_CATEGORY_TITLES = {
+    'base': 'Base Parameters',
+    'vpc': 'VPC & Network',
+    'hosted_zones': 'Route53 Hosted Zones',
+    'build': 'Build Information'
+}
+
+
+def format_params_pretty(params, metadata=None):
     """
     Formats parameters in a structured, easy-to-read format.
     Groups parameters by category and highlights missing values.
     
     Args:
         params: Dictionary of resolved parameters
+        metadata: Category-to-keys mapping (defaults to PARAM_METADATA)
         
     Returns:
         str: Formatted parameter output
     """
-    output_lines = []
-    output_lines.append("\n" + "=" * 80)
-    output_lines.append("RESOLVED PARAMETERS")
-    output_lines.append("=" * 80)
-    
-    # Get metadata if available, otherwise use empty dict
-    metadata = params.get('_metadata', {})
-    
-    # Define categories with display names
-    categories = {
-        'base': 'Base Parameters',
-        'vpc': 'VPC & Network',
-        'hosted_zones': 'Route53 Hosted Zones',
-        'build': 'Build Information',
-        'subnets': 'Subnets',
-        'route_tables': 'Route Tables',
-        'core_stack': 'Core Stack Outputs',
-        'parent_stacks': 'Parent Stack Outputs',
-        'overrides': 'CLI Overrides'
-    }
-    
-    # Track which params have been displayed
-    displayed_params = set(['_metadata'])
-    
-    # Display categorized parameters
-    for category_key, category_name in categories.items():
-        category_params = metadata.get(category_key, [])
-        
-        if category_key == 'subnets':
-            # Special handling for subnets (any param containing 'subnet' but not 'RouteTable')
-            category_params = [k for k in params.keys() if 'subnet' in k.lower() and 'routetable' not in k.lower() and k != '_metadata']
-        elif category_key == 'route_tables':
-            # Special handling for route tables (any param containing 'routetable')
-            category_params = [k for k in params.keys() if 'routetable' in k.lower() and k != '_metadata']
-        elif category_key in ['core_stack', 'parent_stacks', 'overrides']:
-            # These are tracked separately, skip for now
-            continue
-        
-        if category_params:
-            output_lines.append(f"\n{category_name}:")
-            output_lines.append("-" * 40)
-            
-            for param_key in category_params:
-                displayed_params.add(param_key)
-                value = params.get(param_key)
-                
-                if value is None or value == '':
-                    output_lines.append(f"  {param_key:35} = <MISSING>")
-                else:
-                    output_lines.append(f"  {param_key:35} = {value}")
-    
-    # Display subnet parameters if any
-    subnet_params = {k: v for k, v in params.items() if 'subnet' in k.lower() and 'routetable' not in k.lower() and k not in displayed_params}
-    if subnet_params:
-        output_lines.append(f"\nSubnets:")
-        output_lines.append("-" * 40)
-        for param_key in sorted(subnet_params.keys()):
-            displayed_params.add(param_key)
-            value = subnet_params[param_key]
-            if value is None or value == '':
-                output_lines.append(f"  {param_key:35} = <MISSING>")
-            else:
-                output_lines.append(f"  {param_key:35} = {value}")
-    
-    # Display route table parameters if any
-    route_table_params = {k: v for k, v in params.items() if 'routetable' in k.lower() and k not in displayed_params}
-    if route_table_params:
-        output_lines.append(f"\nRoute Tables:")
-        output_lines.append("-" * 40)
-        for param_key in sorted(route_table_params.keys()):
-            displayed_params.add(param_key)
-            value = route_table_params[param_key]
-            if value is None or value == '':
-                output_lines.append(f"  {param_key:35} = <MISSING>")
-            else:
-                output_lines.append(f"  {param_key:35} = {value}")
-    
-    # Display any remaining parameters (from stacks or overrides)
-    remaining_params = {k: v for k, v in params.items() if k not in displayed_params}
-    if remaining_params:
-        output_lines.append(f"\nAdditional Parameters (Stack Outputs & Overrides):")
-        output_lines.append("-" * 40)
-        for param_key in sorted(remaining_params.keys()):
-            value = remaining_params[param_key]
+    if metadata is None:
+        metadata = PARAM_METADATA
+
+    buf = io.StringIO()
+    write = buf.write
+    write("\n" + "=" * 80 + "\n")
+    write("RESOLVED PARAMETERS\n")
+    write("=" * 80)
+
+    # Single pass over the params: each key is lowercased once and dropped
+    # into its bucket, instead of re-scanning params.items() per section.
+    if metadata is PARAM_METADATA:
+        categorized = _DEFAULT_CATEGORIZED
+    else:
+        categorized = frozenset(key for keys in metadata.values() for key in keys)
+    subnet_keys = []
+    route_table_keys = []
+    other_keys = []
+    missing_params = []
+    for key, value in params.items():
+        if value is None or value == '':
+            missing_params.append(key)
+        lowered = key.casefold()
+        if 'routetable' in lowered:
+            route_table_keys.append(key)
+        elif 'subnet' in lowered:
+            subnet_keys.append(key)
+        elif key not in categorized:
+            other_keys.append(key)
+
+    def write_section(section_name, section_keys):
+        write(f"\n\n{section_name}:\n")
+        write("-" * 40)
+        for param_key in section_keys:
+            value = params.get(param_key)
             if value is None or value == '':
-                output_lines.append(f"  {param_key:35} = <MISSING>")
+                write(f"\n  {param_key:35} = <MISSING>")
             else:
-                output_lines.append(f"  {param_key:35} = {value}")
-    
+                write(f"\n  {param_key:35} = {value}")
+
+    for category_key, category_name in _CATEGORY_TITLES.items():
+        category_params = metadata.get(category_key, [])
+        if category_params:
+            write_section(category_name, category_params)
+
+    if subnet_keys:
+        write_section("Subnets", sorted(subnet_keys))
+    if route_table_keys:
+        write_section("Route Tables", sorted(route_table_keys))
+    if other_keys:
+        write_section("Additional Parameters (Stack Outputs & Overrides)", sorted(other_keys))
+
     # Summary of missing parameters
-    missing_params = [k for k, v in params.items() if (v is None or v == '') and k != '_metadata']
     if missing_params:
-        output_lines.append(f"\n" + "!" * 80)
-        output_lines.append(f"WARNING: {len(missing_params)} parameter(s) missing:")
-        output_lines.append("!" * 80)
+        write("\n\n" + "!" * 80 + "\n")
+        write(f"WARNING: {len(missing_params)} parameter(s) missing:\n")
+        write("!" * 80)
         for param in missing_params:
-            output_lines.append(f"  - {param}")
-    
-    output_lines.append("\n" + "=" * 80)
-    output_lines.append(f"Total Parameters: {len(params) - 1}")  # -1 for _metadata
-    output_lines.append(f"Missing Parameters: {len(missing_params)}")
-    output_lines.append("=" * 80 + "\n")
-    
-    return "\n".join(output_lines)
+            write(f"\n  - {param}")
+
+    write("\n\n" + "=" * 80 + "\n")
+    write(f"Total Parameters: {len(params)}\n")
+    write(f"Missing Parameters: {len(missing_params)}\n")
+    write("=" * 80 + "\n")
+
+    return buf.getvalue()
 
 
 def resolve_baseline_params(
@@ -507,7 +609,7 @@ def resolve_baseline_params(
         cli_params_list: List of 'KEY=VALUE' strings for overrides (optional)
         
     Returns:
-        dict: Flat dictionary of resolved parameters
+        dict: Flat dictionary of resolved parameter values (no metadata keys)
         
     Example:
         params = resolve_baseline_params(
@@ -520,15 +622,15 @@ def resolve_baseline_params(
             cli_params_list=["BuildId=custom-123", "CustomParam=value"]
         )
     """
-    print("Starting parameter resolution process...")
-    print(f"AWS Account ID: {aws_account_id}")
-    print(f"AWS Region: {aws_region}")
-    print(f"Resource Name: {resource_name if resource_name else '(not specified)'}")
-    print(f"Environment Name: {environment_name}")
-    print(f"Hosted Zone Suffix: {hosted_zone_suffix}")
+    log.info("Starting parameter resolution process...")
+    log.info(f"AWS Account ID: {aws_account_id}")
+    log.info(f"AWS Region: {aws_region}")
+    log.info(f"Resource Name: {resource_name if resource_name else '(not specified)'}")
+    log.info(f"Environment Name: {environment_name}")
+    log.info(f"Hosted Zone Suffix: {hosted_zone_suffix}")
 
     # 1. Initialize base parameters from CLI arguments
-    print("\n=== Phase 1: Base Parameters from CLI Arguments ===")
+    log.info("\n=== Phase 1: Base Parameters from CLI Arguments ===")
     params = {
         "AccountId": aws_account_id,
         "Region": aws_region,
@@ -537,49 +639,27 @@ def resolve_baseline_params(
     }
     if resource_name:
         params["ResourceName"] = resource_name
-    print(f"Base parameters: {params}")
+    log.info(f"Base parameters: {params}")
 
     # 2. AWS infrastructure discovery
-    print("\n=== Phase 2: AWS Infrastructure Discovery ===")
-    
-    # VPC data
-    vpc_data = get_vpc_data(aws_region, environment_name)
-    params.update(vpc_data)
-
-    # Hosted zone data
-    hosted_zone_data = get_hosted_zone_data(aws_region, hosted_zone_suffix)
-    params.update(hosted_zone_data)
-    
-    # Subnet data
-    vpc_id_for_subnets = params.get("VPCId")
-    if vpc_id_for_subnets:
-        subnet_data = get_subnet_data(aws_region, vpc_id_for_subnets)
-        params.update(subnet_data)
-        
-        # Route table data
-        route_table_data = get_route_table_data(aws_region, vpc_id_for_subnets)
-        params.update(route_table_data)
-    else:
-        print("Warning: VPCId not found in params, skipping subnet and route table data retrieval.")
-
-    # 3. Auto-generated values (BuildId from git)
-    print("\n=== Phase 3: Auto-generated Values ===")
-    if "BuildId" not in params:
-        try:
-            git_hash = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('utf-8').strip()
-            params["BuildId"] = git_hash
-            print(f"Added BuildId from git: {git_hash}")
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Could not determine git revision for BuildId: {e}. BuildId will not be set automatically.")
-        except FileNotFoundError:
-            print("Warning: git command not found. BuildId will not be set automatically.")
-
-    # 4. Parent stack outputs
-    print("\n=== Phase 4: Parent Stack Outputs ===")
+    # The discovery calls are independent HTTPS round trips; running them on
+    # one pool makes the critical path max(latency) instead of the sum. Only
+    # the subnet and route-table fetches depend on the VPC result, so they
+    # are submitted once the VPC future resolves. Results are merged in the
+    # original phase order, so precedence is unchanged.
+    # Parent entries are resolved up front so their fetches can run
+    # concurrently with the discovery calls; the outputs are merged in
+    # phase 4 in the original CSV order, so precedence is unchanged.
+    resolved_parents = []
     if parent_stacks_csv:
+        # The uppercase prefix is the same for every parent entry.
+        if resource_name:
+            stack_name_prefix = f"{resource_name.upper()}-{environment_name.upper()}-"
+        else:
+            stack_name_prefix = f"{environment_name.upper()}-"
         parent_stack_entries = [entry.strip() for entry in parent_stacks_csv.split(',') if entry.strip()]
         if parent_stack_entries:
-            print(f"Processing parent stacks for additional parameters: {parent_stack_entries}")
+            log.info(f"Parent stacks to process: {parent_stack_entries}")
             for parent_entry in parent_stack_entries:
                 # Parse {parent}@{region} format
                 if '@' in parent_entry:
@@ -589,64 +669,99 @@ def resolve_baseline_params(
                 else:
                     parent_stack_base_name = parent_entry
                     stack_region = aws_region  # Default to deployment region
-                
-                if resource_name:
-                    full_parent_stack_name = f"{resource_name.upper()}-{environment_name.upper()}-{parent_stack_base_name}".replace('_', '-')
-                else:
-                    full_parent_stack_name = f"{environment_name.upper()}-{parent_stack_base_name}".replace('_', '-')
-                
-                print(f"Retrieving outputs from parent stack: {full_parent_stack_name} in region {stack_region}...")
-                print(f"  Parent entry: {parent_entry}")
-                print(f"  Base stack name: {parent_stack_base_name}")
-                print(f"  Target region: {stack_region}")
-                
-                parent_outputs = get_stack_outputs(stack_region, resource_name, environment_name, parent_stack_base_name)
-                
-                if parent_outputs:
-                    print(f"Successfully retrieved {len(parent_outputs)} output(s) from parent stack {full_parent_stack_name}")
-                    print(f"Adding outputs from parent stack {full_parent_stack_name}: {parent_outputs}")
-                    params.update(parent_outputs)
-                else:
-                    error_msg = f"CRITICAL ERROR: Failed to retrieve outputs from required parent stack '{full_parent_stack_name}' in region '{stack_region}'. This stack is required for deployment and must exist with valid outputs."
-                    print(f"\n{'!' * 80}")
-                    print(error_msg)
-                    print(f"{'!' * 80}\n")
-                    raise RuntimeError(error_msg)
+
+                full_parent_stack_name = (stack_name_prefix + parent_stack_base_name).replace('_', '-')
+                resolved_parents.append((parent_entry, parent_stack_base_name, stack_region, full_parent_stack_name))
         else:
-            print("No valid parent stack names found in --parent-stacks input.")
+            log.info("No valid parent stack names found in --parent-stacks input.")
+
+    log.info("\n=== Phase 2: AWS Infrastructure Discovery ===")
+    parent_futures = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        vpc_future = executor.submit(get_vpc_data, aws_region, environment_name)
+        hosted_zone_future = executor.submit(get_hosted_zone_data, aws_region, hosted_zone_suffix)
+        build_id_future = None
+        if "BuildId" not in params:
+            build_id_future = executor.submit(_git_short_sha)
+
+        vpc_data = vpc_future.result()
+        vpc_id_for_subnets = vpc_data.get("VPCId")
+        subnet_future = None
+        route_table_future = None
+        if vpc_id_for_subnets:
+            subnet_future = executor.submit(get_subnet_data, aws_region, vpc_id_for_subnets)
+            route_table_future = executor.submit(get_route_table_data, aws_region, vpc_id_for_subnets)
+
+        for parent_entry, parent_stack_base_name, stack_region, full_parent_stack_name in resolved_parents:
+            future = executor.submit(get_stack_outputs, stack_region, resource_name,
+                                     environment_name, parent_stack_base_name)
+            parent_futures.append((future, parent_entry, parent_stack_base_name,
+                                   stack_region, full_parent_stack_name))
+
+        hosted_zone_data = hosted_zone_future.result()
+        subnet_data = subnet_future.result() if subnet_future else {}
+        route_table_data = route_table_future.result() if route_table_future else {}
+
+        # Fail fast: surface a missing parent stack as soon as its future
+        # completes instead of after every fetch has finished.
+        futures_by_handle = {item[0]: item for item in parent_futures}
+        for future in concurrent.futures.as_completed(futures_by_handle):
+            if not future.result():
+                _, parent_entry, _, stack_region, full_parent_stack_name = futures_by_handle[future]
+                error_msg = f"CRITICAL ERROR: Failed to retrieve outputs from required parent stack '{full_parent_stack_name}' in region '{stack_region}'. This stack is required for deployment and must exist with valid outputs."
+                log.info(f"\n{'!' * 80}")
+                log.info(error_msg)
+                log.info(f"{'!' * 80}\n")
+                raise RuntimeError(error_msg)
+
+    params.update(vpc_data)
+    params.update(hosted_zone_data)
+    if vpc_id_for_subnets:
+        params.update(subnet_data)
+        params.update(route_table_data)
+    else:
+        log.warning("Warning: VPCId not found in params, skipping subnet and route table data retrieval.")
+
+    # 3. Auto-generated values (BuildId from git)
+    log.info("\n=== Phase 3: Auto-generated Values ===")
+    if build_id_future is not None:
+        try:
+            git_hash = build_id_future.result()
+            params["BuildId"] = git_hash
+            log.info(f"Added BuildId from git: {git_hash}")
+        except subprocess.CalledProcessError as e:
+            log.warning(f"Warning: Could not determine git revision for BuildId: {e}. BuildId will not be set automatically.")
+        except FileNotFoundError:
+            log.warning("Warning: git command not found. BuildId will not be set automatically.")
+
+    # 4. Parent stack outputs (fetched concurrently above, merged in CSV order)
+    log.info("\n=== Phase 4: Parent Stack Outputs ===")
+    if parent_futures:
+        for future, parent_entry, parent_stack_base_name, stack_region, full_parent_stack_name in parent_futures:
+            parent_outputs = future.result()
+            log.info(f"Successfully retrieved {len(parent_outputs)} output(s) from parent stack {full_parent_stack_name} in region {stack_region}")
+            log.info(f"Adding outputs from parent stack {full_parent_stack_name}: {parent_outputs}")
+            params.update(parent_outputs)
     else:
-        print("No parent stacks specified.")
+        log.info("No parent stacks specified.")
 
     # 5. CLI parameter overrides
-    print("\n=== Phase 5: CLI Parameter Overrides ===")
+    log.info("\n=== Phase 5: CLI Parameter Overrides ===")
     if cli_params_list:
-        print(f"Processing CLI parameters from --param to update gathered params: {cli_params_list}")
-        for p_str in cli_params_list:
-            if '=' in p_str:
-                key, value = p_str.split('=', 1)
-                if key in params:
-                    print(f"Overriding parameter '{key}' with value from --param: '{value}' (was: '{params.get(key)}')")
-                else:
-                    print(f"Adding new parameter from --param: '{key}' = '{value}'")
-                params[key] = value
-            else:
-                print(f"Warning: CLI parameter '{p_str}' from --param is not in KEY=VALUE format and will be ignored.")
+        log.info(f"Processing CLI parameters from --param to update gathered params: {cli_params_list}")
+        overrides = parse_kv_list(
+            cli_params_list,
+            on_malformed=lambda p_str: log.warning(
+                f"Warning: CLI parameter '{p_str}' from --param is not in KEY=VALUE format and will be ignored."))
+        overridden = params.keys() & overrides.keys()
+        if overridden:
+            log.info(f"Overriding gathered parameters from --param: {sorted(overridden)}")
+        params |= overrides
     else:
-        print("No CLI parameter overrides provided.")
+        log.info("No CLI parameter overrides provided.")
 
-    print("\n=== Parameter Resolution Complete ===")
-    print(f"Total parameters resolved: {len(params)}")
-    
-    # Track parameter categories for better organization
-    param_metadata = {
-        'base': ['AccountId', 'Region', 'ResourceName', 'EnvironmentNameLower', 'EnvironmentNameUpper'],
-        'vpc': ['VPCId', 'VPCCidr'],
-        'hosted_zones': ['PublicHostedZoneName', 'PublicHostedZoneId', 'PrivateHostedZoneName', 'PrivateHostedZoneId'],
-        'build': ['BuildId']
-    }
-    
-    # Store metadata in params for display purposes
-    params['_metadata'] = param_metadata
+    log.info("\n=== Parameter Resolution Complete ===")
+    log.info(f"Total parameters resolved: {len(params)}")
     
     return params
 
@@ -763,21 +878,14 @@ Examples:
     if args.output == 'json':
         args.quiet = True
     
-    # Redirect print statements if quiet mode
-    original_print = print
-    if args.quiet:
-        import io
-        import contextlib
-        print_buffer = io.StringIO()
-        def quiet_print(*args_inner, **kwargs):
-            # Only suppress stdout, keep stderr
-            if kwargs.get('file') == sys.stderr:
-                original_print(*args_inner, **kwargs)
-            else:
-                original_print(*args_inner, **kwargs, file=print_buffer)
-        # Temporarily replace print
-        import builtins
-        builtins.print = quiet_print
+    # Progress messages go to stderr via logging; --quiet raises the level
+    # instead of the old builtins.print swap, which was not thread-safe
+    # under the concurrent discovery calls.
+    logging.basicConfig(
+        format="%(message)s",
+        level=logging.WARNING if args.quiet else logging.INFO,
+        stream=sys.stderr,
+    )
     
     try:
         params = resolve_baseline_params(
@@ -790,21 +898,14 @@ Examples:
             cli_params_list=args.param if args.param else None
         )
         
-        # Restore original print if quiet mode
-        if args.quiet:
-            import builtins
-            builtins.print = original_print
-        
         # Output results
         if args.output == "json":
             # JSON output: silent, no headers, just pure JSON
-            output_params = {k: v for k, v in params.items() if k != '_metadata'}
-            print(json.dumps(output_params, indent=2))
+            print(_dumps(params))
         elif args.output == "text":
             # Text output: no header for easy parsing
             for key, value in sorted(params.items()):
-                if key != '_metadata':
-                    print(f"{key}={value}")
+                print(f"{key}={value}")
         else:  # pretty
             # Pretty output: with header
             print("\n=== RESOLVED PARAMETERS ===")
@@ -813,10 +914,6 @@ Examples:
         return 0
         
     except Exception as e:
-        # Restore original print if quiet mode
-        if args.quiet:
-            import builtins
-            builtins.print = original_print
         print(f"\nError: {e}", file=sys.stderr)
         return 1
 
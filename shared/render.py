@@ -1,8 +1,63 @@
-from jinja2 import Environment, FileSystemLoader, BaseLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, BaseLoader, FileSystemBytecodeCache, select_autoescape
+import concurrent.futures
+import functools
+import logging
 import os
 import json
 import argparse
-import boto3
+import sys
+
+from _util import parse_kv_list
+
+log = logging.getLogger(__name__)
+
+# Compact and key-sorted: identical configs serialize to identical bytes, so
+# downstream content-addressed caches see the rendered output as unchanged.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), sort_keys=True)
+
+# Shared Environments: building one per render costs a few ms each and adds
+# up when deploy.py renders several templates in one run.
+# autoescape is off: these are CloudFormation YAML/JSON bodies, and
+# select_autoescape keys off template filenames, which string templates do
+# not have - so it silently never escaped anyway. Disabling it also skips
+# the Markup wrapping on every substitution.
+_string_env = Environment(
+    loader=BaseLoader(),
+    autoescape=False,
+)
+
+@functools.lru_cache(maxsize=128)
+def _compile_string_template(template_string):
+    # deploy.py renders the same CloudFormation template once per parameter
+    # set; compiling is the expensive half, so key the compiled Template on
+    # the source string and only re-render on repeat calls.
+    return _string_env.from_string(template_string)
+
+
+@functools.lru_cache(maxsize=8)
+def _file_env(template_dir):
+    # Persist compiled templates on disk so repeated Jenkins invocations of
+    # render.py skip recompilation; the cache invalidates itself when the
+    # template source changes. JINJA_CACHE_DIR lets jobs point the cache at
+    # a workspace that survives between builds; default is the system temp
+    # dir. auto_reload is off: templates do not change mid-invocation, so
+    # the per-render stat() is wasted.
+    cache_dir = os.environ.get('JINJA_CACHE_DIR')
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
 
 
 def render_template_string(template_string, params_dict, context_key='params'):
@@ -25,25 +80,16 @@ def render_template_string(template_string, params_dict, context_key='params'):
         rendered = render_template_string(template, {"name": "World", "id": "123"})
         # Returns: "Hello World, your ID is 123"
     """
-    env = Environment(
-        loader=BaseLoader(),
-        autoescape=select_autoescape(['html', 'xml', 'yaml', 'json']),
-    )
-    template = env.from_string(template_string)
+    template = _compile_string_template(template_string)
     return template.render({context_key: params_dict})
 
 
 def parse_params(param_list):
     """Converts a list of 'key=value' strings into a dictionary."""
-    params_dict = {}
-    if param_list:
-        for item in param_list:
-            try:
-                key, value = item.split('=', 1)
-                params_dict[key] = value
-            except ValueError:
-                print(f"Warning: Parameter '{item}' is not in 'key=value' format and will be ignored.")
-    return params_dict
+    return parse_kv_list(
+        param_list,
+        on_malformed=lambda item: log.warning(
+            "Warning: Parameter '%s' is not in 'key=value' format and will be ignored.", item))
 
 def get_initial_web_config_from_stacks(aws_region, environment_name, parent_stacks_csv, resource_name=None, stack_params_whitelist_csv=None):
     """
@@ -55,59 +101,92 @@ def get_initial_web_config_from_stacks(aws_region, environment_name, parent_stac
     Supports per-stack region specification using {stack}@{region} format.
     """
     # Import here to avoid circular import
-    from deploy import get_stack_outputs
-    
+    from deploy import get_stack_outputs, get_all_stack_outputs
+
     initial_web_config = {}
     if not all([aws_region, environment_name]):
-        print("Warning: AWS region or environment name not provided. Cannot fetch stack outputs.")
+        log.warning("Warning: AWS region or environment name not provided. Cannot fetch stack outputs.")
         return initial_web_config
 
     whitelist = None
     if stack_params_whitelist_csv:
-        whitelist = {key.strip() for key in stack_params_whitelist_csv.split(',') if key.strip()}
-        print(f"Applying stack parameter whitelist: {whitelist}")
-
-    if parent_stacks_csv:
-        parent_stack_entries = [entry.strip() for entry in parent_stacks_csv.split(',') if entry.strip()]
-        if parent_stack_entries:
-            print(f"Processing parent stacks for initial web_config: {parent_stack_entries}")
-            for parent_entry in parent_stack_entries:
-                # Parse {parent}@{region} format
-                if '@' in parent_entry:
-                    base_stack_name, stack_region = parent_entry.split('@', 1)
-                    base_stack_name = base_stack_name.strip()
-                    stack_region = stack_region.strip()
-                else:
-                    base_stack_name = parent_entry
-                    stack_region = aws_region  # Default to deployment region
-                
-                try:
-                    outputs = get_stack_outputs(stack_region, resource_name, environment_name, base_stack_name)
-                    if outputs:
-                        if resource_name:
-                            full_stack_name_for_log = f"{resource_name.upper()}-{environment_name.upper()}-{base_stack_name}"
-                        else:
-                            full_stack_name_for_log = f"{environment_name.upper()}-{base_stack_name}"
-                        if whitelist:
-                            filtered_outputs = {k: v for k, v in outputs.items() if k in whitelist}
-                            if filtered_outputs:
-                                print(f"Adding whitelisted outputs from parent stack '{full_stack_name_for_log}': {filtered_outputs}")
-                                initial_web_config.update(filtered_outputs)
-                            else:
-                                print(f"No whitelisted outputs found in parent stack '{full_stack_name_for_log}'. Original outputs: {outputs}")
-                        else:
-                            print(f"Adding outputs from parent stack '{full_stack_name_for_log}': {outputs}")
-                            initial_web_config.update(outputs)
-                    else:
-                        if resource_name:
-                            stack_name_for_log = f"{resource_name.upper()}-{environment_name.upper()}-{base_stack_name}"
-                        else:
-                            stack_name_for_log = f"{environment_name.upper()}-{base_stack_name}"
-                        print(f"No outputs found or retrieved for parent stack '{stack_name_for_log}'.")
-                except Exception as e:
-                    print(f"Error retrieving outputs for stack '{base_stack_name}': {e}")
+        whitelist = frozenset(key for key in map(str.strip, stack_params_whitelist_csv.split(',')) if key)
+        log.info("Applying stack parameter whitelist: %s", whitelist)
+
+    if not parent_stacks_csv:
+        return initial_web_config
+
+    parent_stack_entries = [entry for entry in map(str.strip, parent_stacks_csv.split(',')) if entry]
+    if not parent_stack_entries:
+        log.info("No valid parent stack base names found in --parent-stacks input.")
+        return initial_web_config
+
+    log.info("Processing parent stacks for initial web_config: %s", parent_stack_entries)
+    if resource_name:
+        stack_name_prefix = f"{resource_name.upper()}-{environment_name.upper()}-"
+    else:
+        stack_name_prefix = f"{environment_name.upper()}-"
+
+    # Resolve each entry to its region and full stack name up front, then
+    # fetch the distinct targets concurrently. Outputs are merged in the
+    # original CSV order so later entries still win on key conflicts.
+    resolved_entries = []
+    for parent_entry in parent_stack_entries:
+        # Parse {parent}@{region} format
+        if '@' in parent_entry:
+            base_stack_name, stack_region = parent_entry.split('@', 1)
+            base_stack_name = base_stack_name.strip()
+            stack_region = stack_region.strip()
         else:
-            print("No valid parent stack base names found in --parent-stacks input.")
+            base_stack_name = parent_entry
+            stack_region = aws_region  # Default to deployment region
+        full_stack_name = (stack_name_prefix + base_stack_name).replace('_', '-')
+        resolved_entries.append((base_stack_name, stack_region, full_stack_name))
+
+    # Regions with more than two target stacks are fetched with one paginated
+    # describe_stacks listing (deploy.get_all_stack_outputs) instead of one
+    # round trip per stack; small regions stay on the per-stack call, which
+    # is cheaper than listing the whole account.
+    stacks_by_region = {}
+    for base_stack_name, stack_region, full_stack_name in resolved_entries:
+        stacks_by_region.setdefault(stack_region, {})[full_stack_name] = base_stack_name
+
+    batch_futures = {}
+    stack_futures = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for stack_region, targets in stacks_by_region.items():
+            if len(targets) > 2:
+                batch_futures[stack_region] = executor.submit(
+                    get_all_stack_outputs, stack_region, tuple(targets))
+            else:
+                for full_stack_name, base_stack_name in targets.items():
+                    stack_futures[(stack_region, full_stack_name)] = executor.submit(
+                        get_stack_outputs, stack_region, environment_name,
+                        base_stack_name, stack_name=full_stack_name)
+
+        for base_stack_name, stack_region, full_stack_name in resolved_entries:
+            try:
+                if stack_region in batch_futures:
+                    outputs = batch_futures[stack_region].result().get(full_stack_name, {})
+                else:
+                    outputs = stack_futures[(stack_region, full_stack_name)].result()
+            except Exception as e:
+                log.error("Error retrieving outputs for stack '%s': %s", base_stack_name, e)
+                continue
+            if not outputs:
+                log.info("No outputs found or retrieved for parent stack '%s'.", full_stack_name)
+            elif whitelist:
+                # Probe from the whitelist side: curated whitelists are
+                # usually smaller than a stack's output list.
+                filtered_outputs = {k: outputs[k] for k in whitelist if k in outputs}
+                if filtered_outputs:
+                    log.info("Adding whitelisted outputs from parent stack '%s': %s", full_stack_name, filtered_outputs)
+                    initial_web_config.update(filtered_outputs)
+                else:
+                    log.info("No whitelisted outputs found in parent stack '%s'. Original outputs: %s", full_stack_name, outputs)
+            else:
+                log.info("Adding outputs from parent stack '%s': %s", full_stack_name, outputs)
+                initial_web_config.update(outputs)
     return initial_web_config
 
 def main():
@@ -139,10 +218,35 @@ def main():
 
     args = parser.parse_args()
 
+    # RENDER_LOG_LEVEL lets noisy pipelines quieten the per-stack progress
+    # lines without a code change; messages go to stderr so the rendered
+    # output path stays clean for tooling.
+    logging.basicConfig(format="%(message)s",
+                        level=os.environ.get('RENDER_LOG_LEVEL', 'INFO'),
+                        stream=sys.stderr)
+
+    # Load and compile the template before any AWS work so a bad template
+    # path or syntax error fails in milliseconds instead of after seconds
+    # of DescribeStacks round trips.
+    # abspath probes the cwd; skip it when the pipeline already passes an
+    # absolute path (the usual case in Jenkins).
+    template_file = args.template_file if os.path.isabs(args.template_file) \
+        else os.path.abspath(args.template_file)
+    if not os.path.isfile(template_file):
+        parser.error(f"template not found: {args.template_file}")
+    template_dir = os.path.dirname(template_file)
+    template_name = os.path.basename(template_file)
+
+    # Set up Jinja2 environment
+    env = _file_env(template_dir)
+
+    template = env.get_template(template_name)
+    log.info("Done loading template")
+
     # Get initial config from parent stack outputs, applying whitelist if provided
     initial_web_config = get_initial_web_config_from_stacks(
-        args.aws_region, 
-        args.environment_name, 
+        args.aws_region,
+        args.environment_name,
         args.parent_stacks,
         args.resource_name,
         args.stack_params_whitelist
@@ -151,31 +255,38 @@ def main():
     # Get config from --param arguments
     cli_params_config = parse_params(args.param)
 
-    # Merge them, with CLI params taking precedence
-    web_config = {**initial_web_config, **cli_params_config}
-    
-    template_dir = os.path.dirname(os.path.abspath(args.template_file))
-    template_name = os.path.basename(args.template_file)
-
-    # Set up Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
-
-    template = env.get_template(template_name)
-    print("Done loading template")
+    # Merge them, with CLI params taking precedence. Neither dict is used
+    # again, so reuse one in place instead of copying both into a new dict.
+    if not cli_params_config:
+        web_config = initial_web_config
+    elif not initial_web_config:
+        web_config = cli_params_config
+    else:
+        web_config = initial_web_config
+        web_config.update(cli_params_config)
 
     context = {}
-    context['web_config'] = json.dumps(web_config)
-
-    output = template.render(context)
-    print("Done rendering tempalte")
+    context['web_config'] = _dumps(web_config)
 
-    # Write the rendered output to the specified output file
-    with open(args.output_file, 'w') as f:
-      f.write(output)
-    print(f"Successfully rendered template '{args.template_file}' to '{args.output_file}'")
+    # Stream the render straight into the output file instead of building
+    # the whole document in memory first. Write to a temp path and rename
+    # into place so an interrupted render never leaves a partial file for
+    # downstream Jenkins steps to consume.
+    stream = template.stream(context)
+    stream.enable_buffering(64)
+    tmp_file = args.output_file + '.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            stream.dump(f)
+        os.replace(tmp_file, args.output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+    log.info("Done rendering tempalte")
+    log.info("Successfully rendered template '%s' to '%s'", args.template_file, args.output_file)
 
 
 if __name__ == "__main__":